@@ -61,10 +61,10 @@ class GFlowNet(ABC, nn.Module, Generic[TrainingSampleType]):
         return trajectories.last_states
 
     def logz_named_parameters(self):
-        return {k: v for k, v in dict(self.named_parameters()).items() if "logZ" in k}
+        return {k: v for k, v in self.named_parameters() if "logZ" in k}
 
     def logz_parameters(self):
-        return [v for k, v in dict(self.named_parameters()).items() if "logZ" in k]
+        return [v for k, v in self.named_parameters() if "logZ" in k]
 
     @abstractmethod
     def to_training_samples(self, trajectories: Trajectories) -> TrainingSampleType:
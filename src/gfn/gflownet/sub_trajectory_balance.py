@@ -371,11 +371,12 @@ class SubTBGFlowNet(TrajectoryBasedGFlowNet):
         # the following tensor represents the inverse of how many sub-trajectories there are in each trajectory
         contributions = 2.0 / (is_done * (is_done + 1)) / len(trajectories)
 
-        # if we repeat the previous tensor, we get a tensor of shape
+        # if we broadcast the previous tensor, we get a tensor of shape
         # (max_len * (max_len + 1) / 2, n_trajectories) that we can multiply with
         # all_scores to get a loss where each sub-trajectory is weighted equally
-        # within each trajectory.
-        contributions = contributions.repeat(n_rows, 1)
+        # within each trajectory. The expand is a no-copy view, since the rows are
+        # only ever read.
+        contributions = contributions.expand(n_rows, -1)
 
         return contributions
 
@@ -444,7 +445,7 @@ class SubTBGFlowNet(TrajectoryBasedGFlowNet):
 
         # The following tensor represents the inverse of how many transitions
         # there are in each trajectory.
-        contributions = (1.0 / is_done / len(trajectories)).repeat(max_len, 1)
+        contributions = (1.0 / is_done / len(trajectories)).expand(max_len, -1)
         contributions = torch.cat(
             (
                 contributions,
@@ -479,7 +480,7 @@ class SubTBGFlowNet(TrajectoryBasedGFlowNet):
         # The following tensor represents the weights given to each possible
         # sub-trajectory length.
         contributions = (L ** torch.arange(max_len).double()).float()
-        contributions = contributions.unsqueeze(-1).repeat(1, len(trajectories))
+        contributions = contributions.unsqueeze(-1).expand(-1, len(trajectories))
         contributions = contributions.repeat_interleave(
             torch.arange(max_len, 0, -1),
             dim=0,
@@ -118,6 +118,15 @@ class DiscreteEBM(DiscreteEnv):
             preprocessor=preprocessor,
         )
 
+        # Cached, since the state-index computations are on the preprocessing
+        # hot path when using the Enum preprocessor.
+        self._canonical_base = 3 ** torch.arange(
+            self.ndim - 1, -1, -1, device=self.device
+        )
+        self._terminating_canonical_base = 2 ** torch.arange(
+            self.ndim - 1, -1, -1, device=self.device
+        )
+
     def update_masks(self, states: DiscreteStates) -> None:
         states.forward_masks[..., : self.ndim] = states.tensor == -1
         states.forward_masks[..., self.ndim : 2 * self.ndim] = states.tensor == -1
@@ -225,8 +234,7 @@ class DiscreteEBM(DiscreteEnv):
         Returns the states indices as tensor of shape (*batch_shape).
         """
         states_raw = states.tensor
-        canonical_base = 3 ** torch.arange(self.ndim - 1, -1, -1, device=self.device)
-        states_indices = (states_raw + 1).mul(canonical_base).sum(-1).long()
+        states_indices = (states_raw + 1).mul(self._canonical_base).sum(-1).long()
         assert states_indices.shape == states.batch_shape
         return states_indices
 
@@ -243,8 +251,9 @@ class DiscreteEBM(DiscreteEnv):
         Returns the indices of the terminating states as tensor of shape (*batch_shape).
         """
         states_raw = states.tensor
-        canonical_base = 2 ** torch.arange(self.ndim - 1, -1, -1, device=self.device)
-        states_indices = (states_raw).mul(canonical_base).sum(-1).long()
+        states_indices = (
+            (states_raw).mul(self._terminating_canonical_base).sum(-1).long()
+        )
         assert states_indices.shape == states.batch_shape
         return states_indices
 
@@ -112,10 +112,16 @@ class QuarterCircle(Distribution):
         )
         sampled_angles = PI_2 * sampled_angles
 
-        sampled_actions = self.delta * torch.stack(
-            [torch.cos(sampled_angles), torch.sin(sampled_angles)],
-            dim=-1,
+        # The cosine and sine are written directly into a preallocated output
+        # buffer, avoiding the intermediate allocations of a torch.stack.
+        sampled_actions = torch.empty(
+            sampled_angles.shape + (2,),
+            dtype=sampled_angles.dtype,
+            device=sampled_angles.device,
         )
+        torch.cos(sampled_angles, out=sampled_actions[..., 0])
+        torch.sin(sampled_angles, out=sampled_actions[..., 1])
+        sampled_actions *= self.delta
 
         if not self.northeastern:
             # when centers are of norm <= delta, the distribution is a Dirac at the center
@@ -298,15 +304,15 @@ class QuarterDisk(Distribution):
         base_r_01_samples = self.base_r_dist.sample(sample_shape=sample_shape)
         base_theta_01_samples = self.base_theta_dist.sample(sample_shape=sample_shape)
 
-        sampled_actions = self.delta * (
-            torch.stack(
-                [
-                    base_r_01_samples * torch.cos(PI_2 * base_theta_01_samples),
-                    base_r_01_samples * torch.sin(PI_2 * base_theta_01_samples),
-                ],
-                dim=-1,
-            )
+        sampled_angles = PI_2 * base_theta_01_samples
+        sampled_actions = torch.empty(
+            base_r_01_samples.shape + (2,),
+            dtype=base_r_01_samples.dtype,
+            device=base_r_01_samples.device,
         )
+        torch.cos(sampled_angles, out=sampled_actions[..., 0])
+        torch.sin(sampled_angles, out=sampled_actions[..., 1])
+        sampled_actions *= self.delta * base_r_01_samples.unsqueeze(-1)
 
         assert sampled_actions.shape == sample_shape + (2,)
         return sampled_actions
@@ -410,8 +416,9 @@ class QuarterCircleWithExit(Distribution):
         Returns the sampled actions of shape (sample_shape, n_states, 2).
         """
         actions = self.dist_without_exit.sample(sample_shape)
-        repeated_exit_probability = self.exit_probability.repeat(sample_shape + (1,))
-        exit_mask = torch.bernoulli(repeated_exit_probability).bool()
+        # Broadcast with a no-copy view; torch.bernoulli only reads its input.
+        expanded_exit_probability = self.exit_probability.expand(sample_shape + (-1,))
+        exit_mask = torch.bernoulli(expanded_exit_probability).bool()
 
         # TODO: this will BREAK with sample_shape defined not matching
         # self.centers.tensor.shape! Do we need `sample_shape` at all, if not, we should
@@ -434,8 +441,12 @@ class QuarterCircleWithExit(Distribution):
             sampled_actions == torch.full_like(sampled_actions[0], -float("inf")), 1
         )
         logprobs = torch.full_like(self.exit_probability, fill_value=-float("inf"))
-        logprobs[~exit] = self.dist_without_exit.log_prob(sampled_actions)[~exit]
-        logprobs[~exit] = logprobs[~exit] + torch.log(1 - self.exit_probability)[~exit]
+        # The two components (non-exit logprob and log of the continue probability)
+        # are summed before the masked write, so that the mask is applied once.
+        logprobs[~exit] = (
+            self.dist_without_exit.log_prob(sampled_actions)
+            + torch.log(1 - self.exit_probability)
+        )[~exit]
         logprobs[exit] = torch.log(self.exit_probability[exit])
         # When torch.norm(1 - states, dim=-1) <= env.delta, logprobs should be 0
         # When torch.any(self.centers.tensor >= 1 - self.epsilon, dim=-1), logprobs should be 0
@@ -459,11 +470,17 @@ class DistributionWrapper(Distribution):
         n_components,
         n_components_s0,
     ):
-        self.idx_is_initial = torch.where(torch.all(states.tensor == 0, 1))[0]
-        self.idx_not_initial = torch.where(torch.any(states.tensor != 0, 1))[0]
+        # The initial-state test is evaluated once and reused for both index sets.
+        is_initial = torch.all(states.tensor == 0, 1)
+        self.idx_is_initial = torch.where(is_initial)[0]
+        self.idx_not_initial = torch.where(~is_initial)[0]
+        # Cached, to avoid re-reading the index-tensor lengths in sample and
+        # log_prob, which are called once per step of the sampling loop.
+        self._n_initial = len(self.idx_is_initial)
+        self._n_not_initial = len(self.idx_not_initial)
         self._output_shape = states.tensor.shape
         self.quarter_disk = None
-        if len(self.idx_is_initial) > 0:
+        if self._n_initial > 0:
             self.quarter_disk = QuarterDisk(
                 delta=delta,
                 mixture_logits=mixture_logits[self.idx_is_initial[0], :n_components_s0],
@@ -473,7 +490,7 @@ class DistributionWrapper(Distribution):
                 beta_theta=beta_theta[self.idx_is_initial[0], :n_components_s0],
             )
         self.quarter_circ = None
-        if len(self.idx_not_initial) > 0:
+        if self._n_not_initial > 0:
             self.quarter_circ = QuarterCircleWithExit(
                 delta=delta,
                 centers=states[self.idx_not_initial],  # Remove initial states.
@@ -485,18 +502,17 @@ class DistributionWrapper(Distribution):
             )  # no sample_shape req as it is stored in centers.
 
     def sample(self, sample_shape=()):
-        output = torch.zeros(sample_shape + self._output_shape).to(
-            self.idx_is_initial.device
+        output = torch.zeros(
+            sample_shape + self._output_shape, device=self.idx_is_initial.device
         )
 
-        n_disk_samples = len(self.idx_is_initial)
-        if n_disk_samples > 0:
+        if self._n_initial > 0:
             assert self.quarter_disk is not None
             sample_disk = self.quarter_disk.sample(
-                sample_shape=sample_shape + (n_disk_samples,)
+                sample_shape=sample_shape + (self._n_initial,)
             )
             output[self.idx_is_initial] = sample_disk
-        if len(self.idx_not_initial) > 0:
+        if self._n_not_initial > 0:
             assert self.quarter_circ is not None
             sample_circ = self.quarter_circ.sample(sample_shape=sample_shape)
             output[self.idx_not_initial] = sample_circ
@@ -507,16 +523,15 @@ class DistributionWrapper(Distribution):
         return output
 
     def log_prob(self, sampled_actions):
-        log_prob = torch.zeros(sampled_actions.shape[:-1]).to(
-            self.idx_is_initial.device
+        log_prob = torch.zeros(
+            sampled_actions.shape[:-1], device=self.idx_is_initial.device
         )
-        n_disk_samples = len(self.idx_is_initial)
-        if n_disk_samples > 0:
+        if self._n_initial > 0:
             assert self.quarter_disk is not None
             log_prob[self.idx_is_initial] = self.quarter_disk.log_prob(
                 sampled_actions[self.idx_is_initial]
             )
-        if len(self.idx_not_initial) > 0:
+        if self._n_not_initial > 0:
             assert self.quarter_circ is not None
             log_prob[self.idx_not_initial] = self.quarter_circ.log_prob(
                 sampled_actions[self.idx_not_initial]
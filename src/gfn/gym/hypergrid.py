@@ -82,6 +82,11 @@ class HyperGrid(DiscreteEnv):
             preprocessor=preprocessor,
         )
 
+        # Cached, since get_states_indices is on the preprocessing hot path.
+        self._canonical_base = self.height ** torch.arange(
+            self.ndim - 1, -1, -1, device=self.device
+        )
+
     def update_masks(self, states: DiscreteStates) -> None:
         """Update the masks based on the current states."""
         # Not allowed to take any action beyond the environment height, but
@@ -167,10 +172,7 @@ class HyperGrid(DiscreteEnv):
         """
         states_raw = states.tensor
 
-        canonical_base = self.height ** torch.arange(
-            self.ndim - 1, -1, -1, device=states_raw.device
-        )
-        indices = (canonical_base * states_raw).sum(-1).long()
+        indices = (self._canonical_base * states_raw).sum(-1).long()
         assert indices.shape == states.batch_shape
         return indices
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import Any
 
 import torch
@@ -8,6 +9,7 @@ from torch.distributions import Categorical, Distribution
 from gfn.preprocessors import IdentityPreprocessor, Preprocessor
 from gfn.states import DiscreteStates, States
 from gfn.utils.distributions import UnsqueezedCategorical
+from gfn.utils.modules import Tabular
 
 REDUCTION_FXNS = {
     "mean": torch.mean,
@@ -52,6 +54,10 @@ class GFNModule(ABC, nn.Module):
             been verified.
         _is_backward: Flag for tracking whether this estimator is used for predicting
             probability distributions over parents.
+        autocast_dtype: If set (e.g. to torch.bfloat16), the module forward runs
+            under torch.autocast with that dtype and the output is cast back to
+            float32. Doubles tensor-core throughput and halves activation memory
+            on supporting hardware, while downstream loss terms stay in FP32.
     """
 
     def __init__(
@@ -79,6 +85,7 @@ class GFNModule(ABC, nn.Module):
         self.preprocessor = preprocessor
         self._output_dim_is_checked = False
         self.is_backward = is_backward
+        self.autocast_dtype: torch.dtype | None = None
 
     def forward(self, input: States | torch.Tensor) -> torch.Tensor:
         """Forward pass of the module.
@@ -91,7 +98,10 @@ class GFNModule(ABC, nn.Module):
         if isinstance(input, States):
             input = self.preprocessor(input)
 
-        out = self.module(input)
+        with self._autocast_ctx(input.device):
+            out = self.module(input)
+        if self.autocast_dtype is not None:
+            out = out.float()
 
         if not self._output_dim_is_checked:
             self.check_output_dim(out)
@@ -99,9 +109,32 @@ class GFNModule(ABC, nn.Module):
 
         return out
 
+    def _autocast_ctx(self, device: torch.device):
+        """Returns the autocast context for the module call, or a null context."""
+        if self.autocast_dtype is None:
+            return nullcontext()
+        return torch.autocast(device_type=device.type, dtype=self.autocast_dtype)
+
     def __repr__(self):
         return f"{self.__class__.__name__} module"
 
+    def script(self) -> None:
+        """Replaces the encapsulated module with its TorchScript-compiled version.
+
+        Scripting removes Python dispatch overhead from the module call and enables
+        elementwise fusion of the activation functions, which matters in the inner
+        sampling loop where the module is called once per step. Only the leaf
+        `nn.Module` is scripted: the estimator itself (which holds non-scriptable
+        objects such as the preprocessor, operating on `States`) stays eager.
+
+        Raises:
+            ValueError: if the module is a Tabular module, which relies on
+                data-dependent device initialization and cannot be scripted.
+        """
+        if isinstance(self.module, Tabular):
+            raise ValueError("Tabular modules cannot be scripted.")
+        self.module = torch.jit.script(self.module)
+
     @property
     @abstractmethod
     def expected_output_dim(self) -> int:
@@ -206,7 +239,10 @@ class ScalarEstimator(GFNModule):
         if isinstance(input, States):
             input = self.preprocessor(input)
 
-        out = self.module(input)
+        with self._autocast_ctx(input.device):
+            out = self.module(input)
+        if self.autocast_dtype is not None:
+            out = out.float()
 
         # Ensures estimator outputs are always scalar.
         if out.shape[-1] != 1:
@@ -346,9 +382,13 @@ class ConditionalDiscretePolicyEstimator(DiscretePolicyEstimator):
 
         Returns the output of the trunk of the module, as a tensor of shape (*batch_shape, output_dim).
         """
-        state_out = self.module(self.preprocessor(states))
-        conditioning_out = self.conditioning_module(conditioning)
-        out = self.final_module(torch.cat((state_out, conditioning_out), -1))
+        preprocessed = self.preprocessor(states)
+        with self._autocast_ctx(preprocessed.device):
+            state_out = self.module(preprocessed)
+            conditioning_out = self.conditioning_module(conditioning)
+            out = self.final_module(torch.cat((state_out, conditioning_out), -1))
+        if self.autocast_dtype is not None:
+            out = out.float()
 
         return out
 
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from copy import deepcopy
 from typing import Any, List, Optional, Tuple
 
@@ -67,27 +68,41 @@ class Sampler:
                 states.
              - An optional tensor of shape `batch_shape` containing the estimator outputs
         """
+        # Gradients only need to flow through the estimator when the logprobs or the
+        # raw estimator outputs are reused at loss time. Otherwise, the estimator is
+        # evaluated under inference mode, which skips all autograd bookkeeping.
+        needs_grad = save_logprobs or save_estimator_outputs
+        ctx = nullcontext() if needs_grad else torch.inference_mode()
+
         # TODO: Should estimators instead ignore None for the conditioning vector?
-        if conditioning is not None:
-            with has_conditioning_exception_handler("estimator", self.estimator):
-                estimator_output = self.estimator(states, conditioning)
-        else:
-            with no_conditioning_exception_handler("estimator", self.estimator):
-                estimator_output = self.estimator(states)
+        with ctx:
+            if conditioning is not None:
+                with has_conditioning_exception_handler("estimator", self.estimator):
+                    estimator_output = self.estimator(states, conditioning)
+            else:
+                with no_conditioning_exception_handler("estimator", self.estimator):
+                    estimator_output = self.estimator(states)
 
-        dist = self.estimator.to_probability_distribution(
-            states, estimator_output, **policy_kwargs
-        )
+            dist = self.estimator.to_probability_distribution(
+                states, estimator_output, **policy_kwargs
+            )
 
-        with torch.no_grad():
-            actions = dist.sample()
+            with torch.no_grad():
+                actions = dist.sample()
 
-        if save_logprobs:
-            log_probs = dist.log_prob(actions)
-            if torch.any(torch.isinf(log_probs)):
-                raise RuntimeError("Log probabilities are inf. This should not happen.")
-        else:
-            log_probs = None
+            if save_logprobs:
+                log_probs = dist.log_prob(actions)
+                if torch.any(torch.isinf(log_probs)):
+                    raise RuntimeError(
+                        "Log probabilities are inf. This should not happen."
+                    )
+            else:
+                log_probs = None
+
+        if not needs_grad:
+            # Inference tensors cannot be used in autograd-recorded operations, and
+            # the sampled actions are reused at loss time (e.g. to gather logprobs).
+            actions = actions.clone()
 
         actions = env.actions_from_tensor(actions)
         if not save_estimator_outputs:
@@ -365,11 +380,14 @@ class LocalSearchSampler(Sampler):
 
         ### Reconstructing with self.estimator
         n_prevs = prev_trajectories.when_is_done - K - 1
-        junction_states_tsr = torch.gather(
-            prev_trajectories.states.tensor,
-            0,
-            (n_prevs).view(1, -1, 1).expand(-1, -1, *trajectories.states.state_shape),
-        ).squeeze(0)
+        # Unlike gather, advanced indexing silently wraps negative indices, so
+        # guard against K exceeding the trajectory lengths.
+        assert (n_prevs >= 0).all()
+        # Advanced indexing selects state n_prevs[i] of trajectory i in a single
+        # kernel, without materializing the expanded gather index or squeezing.
+        junction_states_tsr = prev_trajectories.states.tensor[
+            n_prevs, torch.arange(len(n_prevs), device=n_prevs.device)
+        ]
         recon_trajectories = super().sample_trajectories(
             env,
             states=env.states_from_tensor(junction_states_tsr),
@@ -15,8 +15,20 @@ class UnsqueezedCategorical(Categorical):
     `gfn/env.py::DiscreteEnv), use an `action_shape = (1,)`. Therefore, according
     to `gfn/actions.py::Actions`, tensors representing actions in discrete environments
     should be of shape (batch_shape, 1).
+
+    Args:
+        gumbel: If True, sample with the Gumbel-max trick (an elementwise
+            perturbation of the logits followed by an argmax) instead of
+            `torch.multinomial`. Both draw from the same distribution, but the
+            Gumbel-max path stays fully vectorized on GPU and scales better with
+            the number of actions. Off by default since it consumes a different
+            random stream than `Categorical.sample`.
     """
 
+    def __init__(self, probs=None, logits=None, validate_args=None, gumbel=False):
+        super().__init__(probs=probs, logits=logits, validate_args=validate_args)
+        self._gumbel = gumbel
+
     def sample(self, sample_shape=torch.Size()) -> torch.Tensor:
         """Sample actions with an unsqueezed final dimension.
 
@@ -25,8 +37,19 @@ class UnsqueezedCategorical(Categorical):
 
         Returns the sampled actions as a tensor of shape (*sample_shape, *batch_shape, 1).
         """
-        out = super().sample(sample_shape).unsqueeze(-1)
-        assert out.shape == sample_shape + self._batch_shape + (1,)
+        if self._gumbel:
+            logits = self.logits
+            if sample_shape:
+                logits = logits.expand(torch.Size(sample_shape) + logits.shape)
+            gumbels = -torch.empty_like(logits).exponential_().log()
+            out = (logits + gumbels).argmax(-1, keepdim=True)
+        else:
+            # Indexing with None takes a C-level fast path compared to unsqueeze.
+            out = super().sample(sample_shape)[..., None]
+        # This method is called once per step of the inner sampling loop, so the
+        # shape check is only performed when assertions are enabled.
+        if __debug__:
+            assert out.shape == sample_shape + self._batch_shape + (1,)
         return out
 
     def log_prob(self, sample: torch.Tensor) -> torch.Tensor:
@@ -37,5 +60,6 @@ class UnsqueezedCategorical(Categorical):
 
         Returns the log probabilities of the sample as a tensor of shape (*sample_shape, *batch_shape).
         """
-        assert sample.shape[-1] == 1
-        return super().log_prob(sample.squeeze(-1))
+        if __debug__:
+            assert sample.shape[-1] == 1
+        return super().log_prob(sample.view(sample.shape[:-1]))
@@ -10,6 +10,7 @@ from gfn.utils.handlers import (
     has_conditioning_exception_handler,
     no_conditioning_exception_handler,
 )
+from gfn.utils.modules import MLP
 
 
 def check_cond_forward(
@@ -31,6 +32,142 @@ def check_cond_forward(
 #########################
 
 
+def _trajectory_pf_masks(
+    trajectories: Trajectories,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Returns the (state_mask, action_mask) pair of valid pf evaluations."""
+    state_mask = ~trajectories.states.is_sink_state
+    action_mask = ~trajectories.actions.is_dummy
+
+    return state_mask, action_mask
+
+
+def _trajectory_pb_masks(
+    trajectories: Trajectories,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Returns the (state_mask, action_mask) pair of valid pb evaluations.
+
+    Note the different mask for valid states and actions compared to the pf case.
+    """
+    state_mask = (
+        ~trajectories.states.is_sink_state & ~trajectories.states.is_initial_state
+    )
+    # We can't calculate the PB of the first state, even it's not an initial state.
+    state_mask[0, :] = False
+    action_mask = ~trajectories.actions.is_dummy & ~trajectories.actions.is_exit
+
+    return state_mask, action_mask
+
+
+def _can_share_preprocessor(
+    pf: GFNModule,
+    pb: GFNModule,
+    trajectories: Trajectories,
+    recalculate_all_logprobs: bool = False,
+) -> bool:
+    """Whether pf and pb can be evaluated on a single shared preprocessor output.
+
+    Sharing is possible when pf and pb hold the same preprocessor object (the
+    standard case, since it comes from the environment), no conditioning is
+    involved, and the pf logprobs actually need to be (re)calculated.
+    """
+    pf_needs_forward = recalculate_all_logprobs or (
+        not has_log_probs(trajectories) and trajectories.estimator_outputs is None
+    )
+
+    return (
+        pf_needs_forward
+        and trajectories.conditioning is None
+        and pf.preprocessor is pb.preprocessor
+    )
+
+
+def _can_fuse_pf_pb(pf: GFNModule, pb: GFNModule) -> bool:
+    """Whether the pf and pb modules can be evaluated with a single fused forward.
+
+    On top of a shareable preprocessor (see `_can_share_preprocessor`), fusing
+    requires pf and pb to be MLPs sharing their trunk, differing only in their
+    final linear heads. Autocast estimators fall back to the shared-preprocessor
+    path, which goes through `GFNModule.forward` and thus honors autocast_dtype.
+    """
+    return (
+        pf.autocast_dtype is None
+        and pb.autocast_dtype is None
+        and type(pf.module) is MLP
+        and type(pb.module) is MLP
+        and pf.module.trunk is pb.module.trunk  # pyright: ignore
+    )
+
+
+def _fused_pf_pb_outputs(
+    pf: GFNModule, pb: GFNModule, trajectories: Trajectories
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Evaluates shared-trunk pf and pb modules with a single fused forward pass.
+
+    The trunk is run once on the pf-valid states (a superset of the pb-valid
+    states), and the two linear heads are horizontally concatenated into a single
+    matmul, halving the number of GEMM launches compared to calling the two
+    modules separately.
+
+    Returns a tuple of estimator outputs for the pf-valid and pb-valid states.
+    """
+    pf_state_mask, _ = _trajectory_pf_masks(trajectories)
+    pb_state_mask, _ = _trajectory_pb_masks(trajectories)
+
+    valid_states = trajectories.states[pf_state_mask]
+    hidden = pf.module.trunk(pf.preprocessor(valid_states))  # pyright: ignore
+
+    weight = torch.cat(
+        (
+            pf.module.last_layer.weight,  # pyright: ignore
+            pb.module.last_layer.weight,  # pyright: ignore
+        ),
+        dim=0,
+    )
+    bias = torch.cat(
+        (
+            pf.module.last_layer.bias,  # pyright: ignore
+            pb.module.last_layer.bias,  # pyright: ignore
+        ),
+        dim=0,
+    )
+    fused_outputs = torch.nn.functional.linear(hidden, weight, bias)
+
+    # Slicing (rather than split) keeps the outputs modifiable in-place, which
+    # to_probability_distribution relies on for masking the logits.
+    pf_outputs = fused_outputs[..., : pf.module.output_dim]  # pyright: ignore
+    pb_outputs = fused_outputs[..., pf.module.output_dim :]  # pyright: ignore
+
+    # The pb-valid states are a subset of the pf-valid states.
+    return pf_outputs, pb_outputs[pb_state_mask[pf_state_mask]]
+
+
+def _shared_preprocessor_outputs(
+    pf: GFNModule, pb: GFNModule, trajectories: Trajectories
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Evaluates pf and pb on a single shared preprocessor output.
+
+    The preprocessor is run once on the pf-valid states (a superset of the
+    pb-valid states), and each module consumes the resulting tensor directly,
+    instead of each estimator preprocessing its own states.
+
+    Returns a tuple of estimator outputs for the pf-valid and pb-valid states.
+    """
+    pf_state_mask, _ = _trajectory_pf_masks(trajectories)
+    pb_state_mask, _ = _trajectory_pb_masks(trajectories)
+
+    valid_states = trajectories.states[pf_state_mask]
+    preprocessed = pf.preprocessor(valid_states)
+
+    with no_conditioning_exception_handler("pf", pf):
+        pf_outputs = pf(preprocessed)
+    with no_conditioning_exception_handler("pb", pb):
+        # The pb-valid states are a subset of the pf-valid states.
+        pb_outputs = pb(preprocessed[pb_state_mask[pf_state_mask]])
+
+    return pf_outputs, pb_outputs
+
+
 def get_trajectory_pfs_and_pbs(
     pf: GFNModule,
     pb: GFNModule,
@@ -38,18 +175,41 @@ def get_trajectory_pfs_and_pbs(
     fill_value: float = 0.0,
     recalculate_all_logprobs: bool = False,
 ) -> Tuple[torch.Tensor, torch.Tensor]:
+    # The (max_length, n_trajectories) batch is flattened to the valid
+    # (non-sink) states before each estimator call, so pf and pb each run as a
+    # single large forward pass rather than one small call per timestep; the
+    # results are scattered back into (max_length, n_trajectories) buffers
+    # through the corresponding action masks.
+
     # fill value is the value used for invalid states (sink state usually)
 
     # uncomment next line for debugging
     # assert trajectories.states.is_sink_state[:-1].equal(trajectories.actions.is_dummy)
 
+    pf_estimator_outputs = pb_estimator_outputs = None
+    if _can_share_preprocessor(pf, pb, trajectories, recalculate_all_logprobs):
+        if _can_fuse_pf_pb(pf, pb):
+            pf_estimator_outputs, pb_estimator_outputs = _fused_pf_pb_outputs(
+                pf, pb, trajectories
+            )
+        else:
+            pf_estimator_outputs, pb_estimator_outputs = _shared_preprocessor_outputs(
+                pf, pb, trajectories
+            )
+
     log_pf_trajectories = get_trajectory_pfs(
         pf,
         trajectories,
         fill_value=fill_value,
         recalculate_all_logprobs=recalculate_all_logprobs,
+        estimator_outputs=pf_estimator_outputs,
+    )
+    log_pb_trajectories = get_trajectory_pbs(
+        pb,
+        trajectories,
+        fill_value=fill_value,
+        estimator_outputs=pb_estimator_outputs,
     )
-    log_pb_trajectories = get_trajectory_pbs(pb, trajectories, fill_value=fill_value)
 
     return log_pf_trajectories, log_pb_trajectories
 
@@ -59,12 +219,14 @@ def get_trajectory_pfs(
     trajectories: Trajectories,
     fill_value: float = 0.0,
     recalculate_all_logprobs: bool = False,
+    estimator_outputs: torch.Tensor | None = None,
 ) -> torch.Tensor:
+    # estimator_outputs, when provided, are the precomputed pf outputs for the
+    # valid (non-sink) states, e.g. coming from a fused pf/pb forward pass.
     if trajectories.is_backward:
         raise ValueError("Backward trajectories are not supported")
 
-    state_mask = ~trajectories.states.is_sink_state
-    action_mask = ~trajectories.actions.is_dummy
+    state_mask, action_mask = _trajectory_pf_masks(trajectories)
 
     valid_states = trajectories.states[state_mask]
     valid_actions = trajectories.actions[action_mask]
@@ -84,7 +246,11 @@ def get_trajectory_pfs(
         if len(valid_states) == 0:
             return log_pf_trajectories
 
-        if trajectories.estimator_outputs is not None and not recalculate_all_logprobs:
+        if estimator_outputs is not None:
+            pass
+        elif (
+            trajectories.estimator_outputs is not None and not recalculate_all_logprobs
+        ):
             estimator_outputs = trajectories.estimator_outputs[action_mask]
         else:
             masked_cond = None
@@ -115,8 +281,14 @@ def get_trajectory_pfs(
 
 
 def get_trajectory_pbs(
-    pb: GFNModule, trajectories: Trajectories, fill_value: float = 0.0
+    pb: GFNModule,
+    trajectories: Trajectories,
+    fill_value: float = 0.0,
+    estimator_outputs: torch.Tensor | None = None,
 ) -> torch.Tensor:
+    # estimator_outputs, when provided, are the precomputed pb outputs for the
+    # valid (non-sink, non-initial) states, e.g. coming from a fused pf/pb
+    # forward pass.
     if trajectories.is_backward:
         raise ValueError("Backward trajectories are not supported")
 
@@ -126,13 +298,7 @@ def get_trajectory_pbs(
         dtype=torch.float,
     )
 
-    # Note the different mask for valid states and actions compared to the pf case.
-    state_mask = (
-        ~trajectories.states.is_sink_state & ~trajectories.states.is_initial_state
-    )
-    # We can't calculate the PB of the first state, even it's not an initial state.
-    state_mask[0, :] = False
-    action_mask = ~trajectories.actions.is_dummy & ~trajectories.actions.is_exit
+    state_mask, action_mask = _trajectory_pb_masks(trajectories)
 
     valid_states = trajectories.states[state_mask]
     valid_actions = trajectories.actions[action_mask]
@@ -143,18 +309,19 @@ def get_trajectory_pbs(
     if len(valid_states) == 0:
         return log_pb_trajectories
 
-    # Using all non-initial states, calculate the backward policy, and the logprobs
-    # of those actions.
-    masked_cond = None
-    if trajectories.conditioning is not None:
-        # We need to index the conditioning vector to broadcast over the states.
-        cond_dim = (-1,) * len(trajectories.conditioning.shape)
-        traj_len = trajectories.states.tensor.shape[0]
-        masked_cond = trajectories.conditioning.unsqueeze(0).expand(
-            (traj_len,) + cond_dim
-        )[state_mask]
-
-    estimator_outputs = check_cond_forward(pb, "pb", valid_states, masked_cond)
+    if estimator_outputs is None:
+        # Using all non-initial states, calculate the backward policy, and the
+        # logprobs of those actions.
+        masked_cond = None
+        if trajectories.conditioning is not None:
+            # We need to index the conditioning vector to broadcast over the states.
+            cond_dim = (-1,) * len(trajectories.conditioning.shape)
+            traj_len = trajectories.states.tensor.shape[0]
+            masked_cond = trajectories.conditioning.unsqueeze(0).expand(
+                (traj_len,) + cond_dim
+            )[state_mask]
+
+        estimator_outputs = check_cond_forward(pb, "pb", valid_states, masked_cond)
 
     valid_log_pb_actions = pb.to_probability_distribution(
         valid_states, estimator_outputs
@@ -1,10 +1,14 @@
+import pytest
+import torch
+
 from gfn.containers import Trajectories
 from gfn.containers.base import Container
 from gfn.gflownet import FMGFlowNet, TBGFlowNet
-from gfn.gym import Box
+from gfn.gym import Box, HyperGrid
 from gfn.gym.helpers.box_utils import BoxPBEstimator, BoxPBMLP, BoxPFEstimator, BoxPFMLP
 from gfn.modules import DiscretePolicyEstimator
 from gfn.states import States
+from gfn.utils.modules import MLP, Tabular
 
 
 def test_trajectory_based_gflownet_generic():
@@ -94,3 +98,42 @@ def test_pytorch_inheritance():
     assert hasattr(
         fmgflownet.state_dict(), "__dict__"
     ), "Expected gflownet to have indexable state_dict() method inherited from nn.Module"
+
+
+def test_estimator_scripting():
+    env = HyperGrid(ndim=2)
+    module = MLP(input_dim=env.preprocessor.output_dim, output_dim=env.n_actions)
+    estimator = DiscretePolicyEstimator(
+        module, n_actions=env.n_actions, preprocessor=env.preprocessor
+    )
+
+    states = env.reset(batch_shape=(7,))
+    eager_output = estimator(states)
+
+    estimator.script()
+    assert isinstance(estimator.module, torch.jit.ScriptModule)
+    assert torch.allclose(estimator(states), eager_output)
+
+    tabular_estimator = DiscretePolicyEstimator(
+        Tabular(n_states=env.n_states, output_dim=env.n_actions),
+        n_actions=env.n_actions,
+        preprocessor=env.preprocessor,
+    )
+    with pytest.raises(ValueError):
+        tabular_estimator.script()
+
+
+def test_estimator_autocast():
+    env = HyperGrid(ndim=2)
+    module = MLP(input_dim=env.preprocessor.output_dim, output_dim=env.n_actions)
+    estimator = DiscretePolicyEstimator(
+        module, n_actions=env.n_actions, preprocessor=env.preprocessor
+    )
+    estimator.autocast_dtype = torch.bfloat16
+
+    states = env.reset(batch_shape=(7,))
+    out = estimator(states)
+
+    # The module runs in reduced precision, but outputs are cast back to FP32.
+    assert out.dtype == torch.float
+    assert out.shape == (7, env.n_actions)
@@ -20,6 +20,7 @@ from gfn.gym.helpers.box_utils import (
 )
 from gfn.modules import DiscretePolicyEstimator, ScalarEstimator
 from gfn.utils.modules import MLP, DiscreteUniform, Tabular
+from gfn.utils.prob_calculations import get_trajectory_pbs, get_trajectory_pfs
 
 N = 10  # Number of trajectories from sample_trajectories (changes tests globally).
 
@@ -336,3 +337,73 @@ def test_subTB_vs_TB(
             env, trajectories
         )  # LogZ is default 0.0.
         assert (tb_loss - subtb_loss).abs() < 1e-4
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_fused_pf_pb_with_tied_trunk(ndim: int):
+    env = HyperGrid(ndim=ndim)
+    pf_module = MLP(input_dim=env.preprocessor.output_dim, output_dim=env.n_actions)
+    pb_module = MLP(
+        input_dim=env.preprocessor.output_dim,
+        output_dim=env.n_actions - 1,
+        trunk=pf_module.trunk,
+    )
+    pf = DiscretePolicyEstimator(
+        module=pf_module, n_actions=env.n_actions, preprocessor=env.preprocessor
+    )
+    pb = DiscretePolicyEstimator(
+        module=pb_module,
+        n_actions=env.n_actions,
+        preprocessor=env.preprocessor,
+        is_backward=True,
+    )
+    gflownet = TBGFlowNet(pf=pf, pb=pb)
+    trajectories = gflownet.sample_trajectories(env, n=N, save_logprobs=False)
+
+    # get_pfs_and_pbs uses the fused (single forward pass) path, since pf and pb
+    # share both the preprocessor and the MLP trunk.
+    log_pfs_fused, log_pbs_fused = gflownet.get_pfs_and_pbs(
+        trajectories, recalculate_all_logprobs=True
+    )
+    log_pfs = get_trajectory_pfs(pf, trajectories, recalculate_all_logprobs=True)
+    log_pbs = get_trajectory_pbs(pb, trajectories)
+
+    assert torch.allclose(log_pfs_fused, log_pfs, atol=1e-5)
+    assert torch.allclose(log_pbs_fused, log_pbs, atol=1e-5)
+
+    loss = gflownet.loss(env, trajectories, recalculate_all_logprobs=True)
+    loss.backward()
+    assert all(p.grad is not None for p in gflownet.pf_pb_parameters())
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_shared_preprocessor_pf_pb(ndim: int):
+    env = HyperGrid(ndim=ndim)
+    pf_module = MLP(input_dim=env.preprocessor.output_dim, output_dim=env.n_actions)
+    pb_module = MLP(input_dim=env.preprocessor.output_dim, output_dim=env.n_actions - 1)
+    pf = DiscretePolicyEstimator(
+        module=pf_module, n_actions=env.n_actions, preprocessor=env.preprocessor
+    )
+    pb = DiscretePolicyEstimator(
+        module=pb_module,
+        n_actions=env.n_actions,
+        preprocessor=env.preprocessor,
+        is_backward=True,
+    )
+    gflownet = TBGFlowNet(pf=pf, pb=pb)
+    trajectories = gflownet.sample_trajectories(env, n=N, save_logprobs=False)
+
+    # get_pfs_and_pbs runs the preprocessor once for both estimators, since pf
+    # and pb hold the same preprocessor object (but independent trunks).
+    log_pfs_shared, log_pbs_shared = gflownet.get_pfs_and_pbs(
+        trajectories, recalculate_all_logprobs=True
+    )
+    log_pfs = get_trajectory_pfs(pf, trajectories, recalculate_all_logprobs=True)
+    log_pbs = get_trajectory_pbs(pb, trajectories)
+
+    assert torch.allclose(log_pfs_shared, log_pfs, atol=1e-5)
+    assert torch.allclose(log_pbs_shared, log_pbs, atol=1e-5)
+
+    loss = gflownet.loss(env, trajectories, recalculate_all_logprobs=True)
+    loss.backward()
+    assert all(p.grad is not None for p in gflownet.pf_pb_parameters())
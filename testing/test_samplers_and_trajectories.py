@@ -9,6 +9,7 @@ from gfn.gym import Box, DiscreteEBM, HyperGrid
 from gfn.gym.helpers.box_utils import BoxPBEstimator, BoxPBMLP, BoxPFEstimator, BoxPFMLP
 from gfn.modules import DiscretePolicyEstimator, GFNModule
 from gfn.samplers import LocalSearchSampler, Sampler
+from gfn.utils.distributions import UnsqueezedCategorical
 from gfn.utils.modules import MLP
 from gfn.utils.prob_calculations import get_trajectory_pfs
 from gfn.utils.training import states_actions_tns_to_traj
@@ -356,3 +357,24 @@ def test_states_actions_tns_to_traj():
     trajs = states_actions_tns_to_traj(states, actions, env)
 
     replay_buffer.add(trajs)
+
+
+def test_unsqueezed_categorical_gumbel_sampling():
+    torch.manual_seed(0)
+    logits = torch.tensor([[0.5, 1.0, -float("inf"), 0.0]]).expand(10000, 4)
+    dist = UnsqueezedCategorical(logits=logits, gumbel=True)
+
+    samples = dist.sample()
+    assert samples.shape == (10000, 1)
+    # The masked action must never be sampled.
+    assert not (samples == 2).any()
+
+    # The empirical frequencies should match the distribution's probabilities.
+    frequencies = torch.bincount(samples.flatten(), minlength=4) / samples.numel()
+    assert torch.allclose(frequencies, torch.softmax(logits[0], -1), atol=0.02)
+
+    # log_prob is unaffected by the sampling path.
+    assert torch.allclose(
+        dist.log_prob(samples),
+        UnsqueezedCategorical(logits=logits).log_prob(samples),
+    )